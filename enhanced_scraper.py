@@ -1,80 +1,35 @@
 #!/usr/bin/env python3
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
-from urllib.parse import quote_plus
+from scrapers import core
 
-def get_headers():
-    user_agents = [
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    ]
-    return {
-        'User-Agent': random.choice(user_agents),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Connection': 'keep-alive'
-    }
-
-def search_comprehensive(company):
-    session = requests.Session()
-    all_questions = set()
-    
-    search_queries = [
-        f"{company} system design interview questions",
-        f"{company} senior software engineer interview system design",
-        f"{company} L5 L6 system design round",
-        f"{company} staff engineer system design interview",
-        f"{company} principal engineer interview experience",
-        f"site:leetcode.com {company} system design",
-        f"site:reddit.com {company} interview system design",
-        f"site:glassdoor.com {company} system design questions",
-        f"site:github.com {company} system design interview",
-        f"{company} onsite interview system design round"
-    ]
-    
-    for query in search_queries:
-        try:
-            url = f"https://duckduckgo.com/html/?q={quote_plus(query)}"
-            response = session.get(url, headers=get_headers(), timeout=10)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                results = soup.find_all('a', class_='result__a')
-                
-                for result in results[:3]:
-                    title = result.get_text(strip=True)
-                    if any(word in title.lower() for word in ['design', 'system', 'interview', 'experience']):
-                        all_questions.add(title)
-            
-            time.sleep(random.uniform(2, 5))
-            
-        except Exception as e:
-            print(f"Error with query '{query}': {e}")
-            continue
-    
-    return list(all_questions)
+SEARCH_QUERIES = [
+    "{company} system design interview questions",
+    "{company} senior software engineer interview system design",
+    "{company} L5 L6 system design round",
+    "{company} staff engineer system design interview",
+    "{company} principal engineer interview experience",
+    "site:leetcode.com {company} system design",
+    "site:reddit.com {company} interview system design",
+    "site:glassdoor.com {company} system design questions",
+    "site:github.com {company} system design interview",
+    "{company} onsite interview system design round"
+]
 
 def main():
     companies = ['Atlassian', 'PayPal', 'Mastercard']
     
     print("🔍 Enhanced scraping for comprehensive system design questions...")
+    print(f"Searching {', '.join(companies)} comprehensively...")
+    
+    results = core.run(
+        companies,
+        SEARCH_QUERIES,
+        'additional_questions.txt',
+        '- ADDITIONAL QUESTIONS FOUND',
+        limit=3
+    )
     
-    with open('additional_questions.txt', 'w', encoding='utf-8') as f:
-        for company in companies:
-            print(f"Searching {company} comprehensively...")
-            questions = search_comprehensive(company)
-            
-            f.write(f"\n{'='*60}\n")
-            f.write(f"{company.upper()} - ADDITIONAL QUESTIONS FOUND\n")
-            f.write(f"{'='*60}\n")
-            
-            for i, question in enumerate(questions, 1):
-                f.write(f"{i}. {question}\n")
-            
-            print(f"Found {len(questions)} additional questions for {company}")
+    for company, questions in results.items():
+        print(f"Found {len(questions)} additional questions for {company}")
     
     print("✅ Additional questions saved to additional_questions.txt")
 
@@ -0,0 +1 @@
+"""Shared session, throttling and parsing for the question scrapers"""
@@ -0,0 +1,232 @@
+"""
+Shared scraping core for the system design question scripts
+One cached aiohttp session, per-host throttling and search result parsing
+"""
+
+import aiohttp
+import asyncio
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from aiolimiter import AsyncLimiter
+from datetime import timedelta
+from lxml import etree
+import json
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus, urlparse
+
+HEADERS_POOL = [
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15'
+]
+
+# Sent on every request by the shared session; only the User-Agent rotates per call
+HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive'
+}
+
+# Optional Brave Search key; without it results come from DuckDuckGo's lite endpoint
+BRAVE_API_KEY = os.environ.get('BRAVE_API_KEY')
+
+KEYWORD_RE = re.compile(r'design|system|interview|experience|architecture', re.IGNORECASE)
+
+# Per-host concurrency caps and (requests, seconds) rate budgets; GitHub's
+# unauthenticated search API allows 10 requests a minute
+HOST_CONCURRENCY = {
+    'leetcode.com': 2,
+    'lite.duckduckgo.com': 3,
+    'api.github.com': 5,
+    'api.search.brave.com': 1
+}
+HOST_RATES = {
+    'leetcode.com': (20, 60),
+    'lite.duckduckgo.com': (20, 60),
+    'api.github.com': (10, 60),
+    'api.search.brave.com': (1, 1)
+}
+
+MAX_RETRIES = 5
+RATE_LIMIT_THRESHOLD = 5
+PARSE_CHUNK_SIZE = 8192
+
+# HTML parsing is CPU-bound, so it runs off the event loop
+PARSE_POOL = ThreadPoolExecutor(max_workers=4)
+
+def get_headers():
+    return {'User-Agent': random.choice(HEADERS_POOL)}
+
+def backoff_delay(attempt):
+    return min(60, 2 ** attempt) + random.random()
+
+async def fetch_with_backoff(session, url, semaphores, limiters, **kwargs):
+    # Cached pages are returned without touching the host's concurrency slot or rate budget
+    cached = await session.cache.get_response(session.cache.create_key('GET', url))
+    if cached is not None:
+        return await cached.text()
+    
+    # Throttle only when the server asks for it instead of sleeping after every request
+    host = urlparse(url).netloc
+    for attempt in range(MAX_RETRIES):
+        retry_delay = None
+        async with semaphores[host], limiters[host], session.get(url, **kwargs) as response:
+            if response.status in (429, 502, 503, 504):
+                retry_after = response.headers.get('Retry-After', '')
+                retry_delay = min(60, int(retry_after)) if retry_after.isdigit() else backoff_delay(attempt)
+            elif response.status != 200:
+                return None
+            else:
+                body = await response.text()
+                if getattr(response, 'from_cache', False):
+                    return body
+                remaining = response.headers.get('X-RateLimit-Remaining', '')
+                reset = response.headers.get('X-RateLimit-Reset', '')
+        
+        # Back off only after the host slot and pooled connection are released
+        if retry_delay is not None:
+            await asyncio.sleep(retry_delay)
+            continue
+        
+        if remaining.isdigit() and int(remaining) < RATE_LIMIT_THRESHOLD:
+            await asyncio.sleep(min(60, max(0, int(reset) - time.time())) if reset.isdigit() else backoff_delay(attempt))
+        return body
+    return None
+
+def search_request(query):
+    """Return the search URL and any extra headers for a query"""
+    if BRAVE_API_KEY:
+        url = f"https://api.search.brave.com/res/v1/web/search?q={quote_plus(query)}"
+        return url, {'Accept': 'application/json', 'X-Subscription-Token': BRAVE_API_KEY}
+    return f"https://lite.duckduckgo.com/lite/?q={quote_plus(query)}", {}
+
+def first_result_titles(html, limit):
+    """Return up to limit result-link titles, parsing only as much of the page as needed"""
+    parser = etree.HTMLPullParser(events=('end',), tag='a')
+    titles = []
+    for start in range(0, len(html), PARSE_CHUNK_SIZE):
+        parser.feed(html[start:start + PARSE_CHUNK_SIZE])
+        for _, element in parser.read_events():
+            if 'result-link' in (element.get('class') or '').split():
+                titles.append(''.join(element.itertext()).strip())
+                if len(titles) >= limit:
+                    return titles
+    return titles
+
+def parse_duckduckgo(body, limit):
+    """Return matching titles from the first results of a search response"""
+    if not body:
+        return []
+    
+    if BRAVE_API_KEY:
+        results = json.loads(body).get('web', {}).get('results', [])
+        candidates = [result.get('title', '') for result in results[:limit]]
+    else:
+        candidates = first_result_titles(body, limit)
+    
+    return [title for title in candidates if KEYWORD_RE.search(title)]
+
+def unique_titles(titles, seen):
+    """Drop titles already in seen, recording the ones that are kept"""
+    unique = []
+    for title in titles:
+        t = sys.intern(title)
+        if t in seen:
+            continue
+        seen.add(t)
+        unique.append(t)
+    return unique
+
+class Scraper:
+    """Owns the cached, pooled session shared by every request"""
+    
+    def __init__(self):
+        self.cache = SQLiteBackend(
+            'scraper_cache_async',
+            expire_after=timedelta(hours=24),
+            allowed_codes=(200,),
+            allowed_methods=('GET',)
+        )
+        # Opened on entry, since aiohttp sessions must live inside the event loop
+        self.session = None
+        self.semaphores = {}
+        self.limiters = {}
+        self.seen = set()
+        self.timeout = aiohttp.ClientTimeout(total=10)
+    
+    async def __aenter__(self):
+        # Throttling state is created per run, since asyncio primitives bind to the
+        # event loop that first uses them; titles are only de-duplicated within a run
+        self.semaphores = {host: asyncio.Semaphore(n) for host, n in HOST_CONCURRENCY.items()}
+        self.limiters = {host: AsyncLimiter(*rate) for host, rate in HOST_RATES.items()}
+        self.seen = set()
+        connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+        self.session = CachedSession(cache=self.cache, connector=connector, headers=HEADERS)
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+    
+    async def fetch(self, url, headers=None, **kwargs):
+        """GET a URL's body with a rotated User-Agent, or None on failure"""
+        return await fetch_with_backoff(
+            self.session, url, self.semaphores, self.limiters,
+            headers={**get_headers(), **(headers or {})}, timeout=self.timeout, **kwargs
+        )
+    
+    async def search(self, query, limit):
+        """Run a web search and return matching titles from the first results"""
+        url, headers = search_request(query)
+        body = await self.fetch(url, headers=headers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(PARSE_POOL, parse_duckduckgo, body, limit)
+    
+    async def search_company(self, company, queries, limit, known=()):
+        """Run every query template for a company and collect the matching titles"""
+        searches = [query.format(company=company) for query in queries]
+        pages = await asyncio.gather(*(self.search(q, limit) for q in searches), return_exceptions=True)
+        
+        questions = []
+        for query, titles in zip(searches, pages):
+            if isinstance(titles, Exception):
+                print(f"Error with query '{query}': {titles}")
+                continue
+            questions.extend(titles)
+        questions.extend(known)
+        
+        return questions
+
+async def scrape(companies, queries, limit, known):
+    async with Scraper() as scraper:
+        results = await asyncio.gather(
+            *(scraper.search_company(c, queries, limit, known.get(c, ())) for c in companies)
+        )
+        # De-duplicate in input order so a shared title always stays with the same company
+        return {c: unique_titles(questions, scraper.seen) for c, questions in zip(companies, results)}
+
+def write_report(results, output, heading):
+    with open(output, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for company, questions in results.items():
+            chunks = [
+                f"\n{'='*60}\n",
+                f"{company.upper()} {heading}\n",
+                f"{'='*60}\n"
+            ]
+            chunks.extend(f"{i}. {question}\n" for i, question in enumerate(questions, 1))
+            f.write("".join(chunks))
+
+def run(companies, queries, output, heading, limit=3, known=None):
+    """Search every company concurrently and write a numbered text report
+    
+    queries are templates formatted with company=..., and known maps a company
+    to questions appended after the search results.
+    """
+    results = asyncio.run(scrape(companies, queries, limit, known or {}))
+    write_report(results, output, heading)
+    return results